@@ -1,3 +1,5 @@
+import functools
+import os
 import yaml
 import logging
 from pathlib import Path
@@ -6,20 +8,39 @@ from typing import Dict, Any, Optional
 # Use basic logging to avoid circular import
 logger = logging.getLogger(__name__)
 
+# C loader when libyaml is available; an order of magnitude faster than the
+# pure-Python tokenizer
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+
+@functools.lru_cache(maxsize=16)
+def _load_yaml_cached(path: str, mtime_ns: int, size: int) -> Dict[str, Any]:
+    """Parse a YAML file, cached on (path, mtime, size).
+
+    Services construct YamlConfig for the same file in several modules;
+    keying on the stat result means each on-disk version is parsed once
+    per process while edits still trigger a re-parse.
+    """
+    # Binary mode lets the loader do the UTF-8 decode itself (in C when
+    # libyaml is present) instead of going through Python's text layer
+    with open(path, 'rb') as f:
+        return yaml.load(f, Loader=_YAML_LOADER) or {}
+
 
 class YamlConfig:
     def __init__(self, config_path: str):
         self.config_path = Path(config_path)
         self.config: Dict[str, Any] = {}
         self.load()
-    
+
     def load(self):
-        if not self.config_path.exists():
+        try:
+            stat = os.stat(self.config_path)
+        except OSError:
             raise FileNotFoundError(f"Config file not found: {self.config_path}")
-        
-        with open(self.config_path, 'r', encoding='utf-8') as f:
-            self.config = yaml.safe_load(f) or {}
-        
+
+        self.config = _load_yaml_cached(str(self.config_path), stat.st_mtime_ns, stat.st_size)
+
         logger.info(f"Config loaded from {self.config_path}")
     
     def get(self, key: str, default: Any = None) -> Any:
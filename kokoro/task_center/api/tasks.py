@@ -135,13 +135,16 @@ async def get_task(
 @router.get("", response_model=TaskListResponse)
 async def list_tasks(
     status: TaskStatus = None,
+    workflow_type: str = None,
     page: int = 1,
     page_size: int = 20,
     api_key: str = Security(verify_api_key),
     db: Session = Depends(get_db)
 ):
     repository = TaskRepository(db)
-    tasks, total = repository.list_tasks(status=status, page=page, page_size=page_size)
+    tasks, total = repository.list_tasks(
+        status=status, workflow_type=workflow_type, page=page, page_size=page_size
+    )
     
     return TaskListResponse(
         workflows=[TaskResponse.from_orm(t) for t in tasks],
@@ -19,14 +19,17 @@ class TaskRepository:
     def list_tasks(
         self,
         status: Optional[TaskStatus] = None,
+        workflow_type: Optional[str] = None,
         page: int = 1,
         page_size: int = 20
     ) -> Tuple[List[Task], int]:
         query = self.db.query(Task)
-        
+
         if status:
             query = query.filter(Task.status == status)
-        
+        if workflow_type:
+            query = query.filter(Task.workflow_type == workflow_type)
+
         total = query.count()
         
         tasks = query.offset((page - 1) * page_size).limit(page_size).all()
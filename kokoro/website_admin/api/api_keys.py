@@ -4,7 +4,8 @@ from typing import List, Optional
 from kokoro.common.database import get_db
 from kokoro.website_admin.models.api_key import ApiKey
 from kokoro.website_admin.schemas.api_key import (
-    ApiKeyCreate, ApiKeyUpdate, ApiKeyResponse, ApiKeyListResponse
+    ApiKeyCreate, ApiKeyUpdate, ApiKeyResponse, ApiKeyListResponse,
+    ApiKeyResponseListAdapter
 )
 from kokoro.common.utils.logging import setup_logger
 import secrets
@@ -28,6 +29,11 @@ def hash_api_key(key: str) -> str:
     return hashlib.sha256(key.encode()).hexdigest()
 
 
+def mask_api_key(key_hash: str) -> str:
+    """Mask a stored key hash, keeping a partial suffix for identification."""
+    return "kokoro_***" + (key_hash[-12:] if key_hash and len(key_hash) > 12 else "***")
+
+
 @router.post("", response_model=ApiKeyResponse)
 async def create_api_key(
     api_key_data: ApiKeyCreate,
@@ -97,21 +103,23 @@ async def list_api_keys(
         api_keys = db.query(ApiKey).offset(skip).limit(limit).all()
         
         # Return keys without showing the actual key value (for security)
-        # Since we store hashes, we can't show partial key - show masked version
-        response_keys = []
-        for key in api_keys:
-            response_keys.append(ApiKeyResponse(
-                id=key.id,
-                name=key.name,
-                key="kokoro_***" + (key.key[-12:] if len(key.key) > 12 else "***"),  # Show partial hash for identification
-                description=key.description,
-                is_active=key.is_active,
-                created_by=key.created_by,
-                last_used_at=key.last_used_at,
-                expires_at=key.expires_at,
-                created_at=key.created_at,
-                updated_at=key.updated_at
-            ))
+        # Since we store hashes, we can't show partial key - show masked version.
+        # Batch-validate the whole list through the pre-compiled adapter.
+        response_keys = ApiKeyResponseListAdapter.validate_python([
+            {
+                "id": key.id,
+                "name": key.name,
+                "key": mask_api_key(key.key),
+                "description": key.description,
+                "is_active": key.is_active,
+                "created_by": key.created_by,
+                "last_used_at": key.last_used_at,
+                "expires_at": key.expires_at,
+                "created_at": key.created_at,
+                "updated_at": key.updated_at
+            }
+            for key in api_keys
+        ])
         
         return ApiKeyListResponse(api_keys=response_keys, total=total)
         
@@ -134,7 +142,7 @@ async def get_api_key(
         return ApiKeyResponse(
             id=api_key.id,
             name=api_key.name,
-            key="kokoro_***" + (api_key.key[-12:] if api_key.key and len(api_key.key) > 12 else "***"),
+            key=mask_api_key(api_key.key),
             description=api_key.description,
             is_active=api_key.is_active,
             created_by=api_key.created_by,
@@ -180,7 +188,7 @@ async def update_api_key(
         return ApiKeyResponse(
             id=api_key.id,
             name=api_key.name,
-            key="kokoro_***" + (api_key.key[-12:] if api_key.key and len(api_key.key) > 12 else "***"),
+            key=mask_api_key(api_key.key),
             description=api_key.description,
             is_active=api_key.is_active,
             created_by=api_key.created_by,
@@ -31,7 +31,7 @@ def list_menus(
     """List all menus"""
     menus = db.query(Menu).order_by(Menu.order, Menu.id).offset(skip).limit(limit).all()
     total = db.query(Menu).count()
-    return MenuListResponse(menus=[MenuResponse.model_validate(m) for m in menus], total=total)
+    return MenuListResponse.validate_rows(menus, total)
 
 
 @router.get("/menus/user", response_model=List[MenuResponse])
@@ -109,7 +109,7 @@ async def get_role(
         description=role.description,
         is_system=role.is_system,
         is_active=role.is_active,
-        permissions=[PermissionResponse.from_orm(p.permission) for p in role.permissions if p.permission.is_active],
+        permissions=[PermissionResponse.model_validate(p.permission) for p in role.permissions if p.permission.is_active],
         user_count=user_count,
         created_at=role.created_at
     )
@@ -164,7 +164,7 @@ async def create_role(
         description=new_role.description,
         is_system=new_role.is_system,
         is_active=new_role.is_active,
-        permissions=[PermissionResponse.from_orm(p.permission) for p in new_role.permissions if p.permission.is_active],
+        permissions=[PermissionResponse.model_validate(p.permission) for p in new_role.permissions if p.permission.is_active],
         user_count=user_count,
         created_at=new_role.created_at
     )
@@ -235,7 +235,7 @@ async def update_role(
         description=role.description,
         is_system=role.is_system,
         is_active=role.is_active,
-        permissions=[PermissionResponse.from_orm(p.permission) for p in role.permissions if p.permission.is_active],
+        permissions=[PermissionResponse.model_validate(p.permission) for p in role.permissions if p.permission.is_active],
         user_count=user_count,
         created_at=role.created_at
     )
@@ -71,10 +71,7 @@ async def list_templates(
         total = query.count()
         templates = query.offset(skip).limit(limit).all()
         
-        return TaskTemplateListResponse(
-            templates=[TaskTemplateResponse.model_validate(t) for t in templates],
-            total=total
-        )
+        return TaskTemplateListResponse.validate_rows(templates, total)
         
     except Exception as e:
         logger.error(f"Error listing task templates: {e}", exc_info=True)
@@ -1,4 +1,4 @@
-from fastapi import APIRouter, HTTPException, Depends
+from fastapi import APIRouter, HTTPException, Depends, Response
 from sqlalchemy.orm import Session
 from sqlalchemy import or_, and_
 from kokoro.website_admin.schemas.task import (
@@ -96,7 +96,8 @@ async def publish_task(request: TaskPublishRequest, db: Session = Depends(get_db
                     raise
                 db.refresh(task)
 
-        return TaskPublishResponse(
+        # Values come straight from our own ORM row; skip re-validation
+        return TaskPublishResponse.model_construct(
             status=task.status.value,
             workflow_id=task.workflow_id,
             announcement_start=task.announcement_start,
@@ -186,7 +187,8 @@ async def get_task(workflow_id: str, db: Session = Depends(get_db)):
         elif task.status == TaskStatus.ENDED:
             display_status = TaskStatus.COMPLETED.value
         
-        return TaskInfo(
+        # Built from our own ORM row; skip re-validation
+        return TaskInfo.model_construct(
             task_id=task.task_id,
             workflow_id=task.workflow_id,
             workflow_type=task.workflow_type.value,
@@ -268,7 +270,7 @@ async def list_tasks(
             elif task.status == TaskStatus.ENDED:
                 display_status = TaskStatus.COMPLETED.value
             
-            workflows.append(TaskInfo(
+            workflows.append(TaskInfo.model_construct(
                 task_id=task.task_id,
                 workflow_id=task.workflow_id,
                 workflow_type=task.workflow_type.value,
@@ -297,10 +299,14 @@ async def list_tasks(
             "total_pages": (total + page_size - 1) // page_size if page_size > 0 else 0
         }
         
-        return TaskListResponse(
+        result = TaskListResponse.model_construct(
             workflows=workflows,
             pagination=pagination
         )
+        # Serialize list pages with the compiled pydantic-core serializer and
+        # hand FastAPI finished bytes; returning a Response skips the output
+        # re-validation and jsonable_encoder pass over every row
+        return Response(content=result.model_dump_json(), media_type="application/json")
     except Exception as e:
         logger.error(f"Unexpected error listing tasks: {e}", exc_info=True)
         raise HTTPException(status_code=500, detail=f"Failed to list tasks: {str(e)}")
@@ -1,5 +1,5 @@
 from kokoro.website_admin.database.init_db import init_db, init_data
-from kokoro.website_admin.database.migration_runner import run_migrations
+from kokoro.website_admin.database.migration_runner import run_migrations, run_migrations_async
 
-__all__ = ["init_db", "init_data", "run_migrations"]
+__all__ = ["init_db", "init_data", "run_migrations", "run_migrations_async"]
 
@@ -1,387 +1,489 @@
+import functools
+from types import MappingProxyType
+
+from sqlalchemy import delete, inspect
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+
 from kokoro.common.database.base import Base
 from kokoro.common.database import engine, SessionLocal
 from kokoro.website_admin.models import TaskTemplate, TaskHistory, OperationLog, User
 from kokoro.website_admin.models.role import Role, Permission, RolePermission
 from kokoro.website_admin.models.menu import Menu
-from kokoro.website_admin.api.auth import get_password_hash
+# Import Task from common models so the tasks table is registered on Base.metadata
+from kokoro.common.models.task import Task
 from kokoro.common.utils.logging import setup_logger
+import bcrypt
 
 logger = setup_logger(__name__)
 
 
-def init_db():
-    # Import all models to ensure they are registered with SQLAlchemy Base metadata
-    from kokoro.website_admin.models import TaskTemplate, TaskHistory, OperationLog, User
-    from kokoro.website_admin.models.role import Role, Permission, RolePermission
-    from kokoro.website_admin.models.menu import Menu
-    # Import Task model from common models to ensure tasks table is created
-    from kokoro.common.models.task import Task
-    
-    Base.metadata.create_all(bind=engine)
-    logger.info("Website admin database tables created successfully (including tasks table)")
+def _freeze(value):
+    """Recursively wrap dicts in read-only proxies so seed data cannot be mutated."""
+    if isinstance(value, dict):
+        return MappingProxyType({k: _freeze(v) for k, v in value.items()})
+    if isinstance(value, list):
+        return tuple(_freeze(v) for v in value)
+    return value
 
 
-def init_data():
-    db = SessionLocal()
-    try:
-        default_templates = [
-            {
-                "name": "text_lora_new_default",
-                "description": "Default template for new text LoRA training",
-                "workflow_type": "text_lora_creation",
-                "workflow_spec": {
-                    "theme": "japanese_culture_chat",
-                    "target_platform": "mobile",
-                    "deployment_target": "mobile_app",
-                    "training_mode": "new",
-                    "dataset_spec": {
-                        "source": "huggingface",
-                        "repository_id": "kokoro/japanese-culture-qa-dataset",
-                        "sample_count": 2000,
-                        "data_format": "jsonl",
-                        "question_column": "question",
-                        "answer_column": "answer"
-                    },
-                    "training_spec": {
-                        "base_model": "Qwen/Qwen3-0.6B",
-                        "lora_rank": 16,
-                        "lora_alpha": 32,
-                        "iteration_count": 1000,
-                        "batch_size": 4,
-                        "learning_rate": 2e-4,
-                        "max_length": 512
-                    }
-                },
-                "announcement_duration": "0.25",
-                "execution_duration": "3.0",
-                "review_duration": "1.0",
-                "reward_duration": "0.0"
+def _thaw(value):
+    """Convert frozen seed data back into plain dicts/lists for SQLAlchemy."""
+    if isinstance(value, MappingProxyType):
+        return {k: _thaw(v) for k, v in value.items()}
+    if isinstance(value, tuple):
+        return [_thaw(v) for v in value]
+    return value
+
+
+# Default seed data, built once at import time instead of on every init_data() call.
+_DEFAULT_TEMPLATES = tuple(_freeze(t) for t in [
+    {
+        "name": "text_lora_new_default",
+        "description": "Default template for new text LoRA training",
+        "workflow_type": "text_lora_creation",
+        "workflow_spec": {
+            "theme": "japanese_culture_chat",
+            "target_platform": "mobile",
+            "deployment_target": "mobile_app",
+            "training_mode": "new",
+            "dataset_spec": {
+                "source": "huggingface",
+                "repository_id": "kokoro/japanese-culture-qa-dataset",
+                "sample_count": 2000,
+                "data_format": "jsonl",
+                "question_column": "question",
+                "answer_column": "answer"
             },
-            {
-                "name": "text_lora_incremental_default",
-                "description": "Default template for incremental text LoRA training",
-                "workflow_type": "text_lora_creation",
-                "workflow_spec": {
-                    "theme": "japanese_culture_chat",
-                    "target_platform": "mobile",
-                    "deployment_target": "mobile_app",
-                    "training_mode": "incremental",
-                    "dataset_spec": {
-                        "source": "huggingface",
-                        "repository_id": "kokoro/japanese-culture-qa-dataset-v2",
-                        "sample_count": 1500,
-                        "data_format": "jsonl",
-                        "question_column": "question",
-                        "answer_column": "answer"
-                    },
-                    "training_spec": {
-                        "base_model": "Qwen/Qwen3-0.6B",
-                        "lora_rank": 16,
-                        "lora_alpha": 32,
-                        "iteration_count": 800,
-                        "batch_size": 4,
-                        "learning_rate": 1e-4,
-                        "max_length": 512
-                    }
-                },
-                "announcement_duration": "0.25",
-                "execution_duration": "3.0",
-                "review_duration": "1.0",
-                "reward_duration": "0.0"
+            "training_spec": {
+                "base_model": "Qwen/Qwen3-0.6B",
+                "lora_rank": 16,
+                "lora_alpha": 32,
+                "iteration_count": 1000,
+                "batch_size": 4,
+                "learning_rate": 2e-4,
+                "max_length": 512
+            }
+        },
+        "announcement_duration": "0.25",
+        "execution_duration": "3.0",
+        "review_duration": "1.0",
+        "reward_duration": "0.0"
+    },
+    {
+        "name": "text_lora_incremental_default",
+        "description": "Default template for incremental text LoRA training",
+        "workflow_type": "text_lora_creation",
+        "workflow_spec": {
+            "theme": "japanese_culture_chat",
+            "target_platform": "mobile",
+            "deployment_target": "mobile_app",
+            "training_mode": "incremental",
+            "dataset_spec": {
+                "source": "huggingface",
+                "repository_id": "kokoro/japanese-culture-qa-dataset-v2",
+                "sample_count": 1500,
+                "data_format": "jsonl",
+                "question_column": "question",
+                "answer_column": "answer"
             },
-            {
-                "name": "image_lora_new_default",
-                "description": "Default template for new image LoRA training",
-                "workflow_type": "image_lora_creation",
-                "workflow_spec": {
-                    "theme": "manga_style",
-                    "target_platform": "executor",
-                    "deployment_target": "executor_node",
-                    "training_mode": "new",
-                    "dataset_spec": {
-                        "source": "huggingface",
-                        "repository_id": "kokoro/manga-style-dataset",
-                        "sample_count": 200,
-                        "image_column": "image",
-                        "caption_column": "text"
-                    },
-                    "training_spec": {
-                        "base_model": "black-forest-labs/FLUX.1-dev",
-                        "lora_rank": 16,
-                        "lora_alpha": 32,
-                        "iteration_count": 1000,
-                        "batch_size": 2,
-                        "learning_rate": 1e-4,
-                        "resolution": [512, 768]
-                    }
-                },
-                "announcement_duration": "0.25",
-                "execution_duration": "3.0",
-                "review_duration": "1.0",
-                "reward_duration": "0.0"
+            "training_spec": {
+                "base_model": "Qwen/Qwen3-0.6B",
+                "lora_rank": 16,
+                "lora_alpha": 32,
+                "iteration_count": 800,
+                "batch_size": 4,
+                "learning_rate": 1e-4,
+                "max_length": 512
+            }
+        },
+        "announcement_duration": "0.25",
+        "execution_duration": "3.0",
+        "review_duration": "1.0",
+        "reward_duration": "0.0"
+    },
+    {
+        "name": "image_lora_new_default",
+        "description": "Default template for new image LoRA training",
+        "workflow_type": "image_lora_creation",
+        "workflow_spec": {
+            "theme": "manga_style",
+            "target_platform": "executor",
+            "deployment_target": "executor_node",
+            "training_mode": "new",
+            "dataset_spec": {
+                "source": "huggingface",
+                "repository_id": "kokoro/manga-style-dataset",
+                "sample_count": 200,
+                "image_column": "image",
+                "caption_column": "text"
             },
-            {
-                "name": "image_lora_incremental_default",
-                "description": "Default template for incremental image LoRA training",
-                "workflow_type": "image_lora_creation",
-                "workflow_spec": {
-                    "theme": "manga_style",
-                    "target_platform": "executor",
-                    "deployment_target": "executor_node",
-                    "training_mode": "incremental",
-                    "dataset_spec": {
-                        "source": "huggingface",
-                        "repository_id": "kokoro/manga-style-dataset-v2",
-                        "sample_count": 150,
-                        "image_column": "image",
-                        "caption_column": "text"
-                    },
-                    "training_spec": {
-                        "base_model": "black-forest-labs/FLUX.1-dev",
-                        "lora_rank": 16,
-                        "lora_alpha": 32,
-                        "iteration_count": 800,
-                        "batch_size": 2,
-                        "learning_rate": 5e-5,
-                        "resolution": [512, 768]
-                    }
-                },
-                "announcement_duration": "0.25",
-                "execution_duration": "3.0",
-                "review_duration": "1.0",
-                "reward_duration": "0.0"
+            "training_spec": {
+                "base_model": "black-forest-labs/FLUX.1-dev",
+                "lora_rank": 16,
+                "lora_alpha": 32,
+                "iteration_count": 1000,
+                "batch_size": 2,
+                "learning_rate": 1e-4,
+                "resolution": [512, 768]
             }
-        ]
-        
-        for template_data in default_templates:
-            existing = db.query(TaskTemplate).filter(
-                TaskTemplate.name == template_data["name"]
-            ).first()
-            
-            if not existing:
-                template = TaskTemplate(**template_data)
-                db.add(template)
-                logger.info(f"Created default template: {template_data['name']}")
-        
-        db.commit()
-        logger.info("Default task templates initialized successfully")
-        
-        # Initialize default permissions (menus)
-        default_permissions = [
-            {"code": "dashboard", "name": "Dashboard", "menu_path": "/dashboard", "menu_icon": "LayoutDashboard", "menu_order": 1},
-            {"code": "tasks", "name": "Tasks & Workflows", "menu_path": "/tasks", "menu_icon": "ListTodo", "menu_order": 2},
-            {"code": "create_task", "name": "Create Task", "menu_path": "/create-task", "menu_icon": "PlusCircle", "menu_order": 3},
-            {"code": "task_templates", "name": "Training Templates", "menu_path": "/task-templates", "menu_icon": "FileText", "menu_order": 4},
-            {"code": "miners", "name": "Miners", "menu_path": "/miners", "menu_icon": "Users", "menu_order": 5},
-            {"code": "validators", "name": "Validators", "menu_path": "/validators", "menu_icon": "Network", "menu_order": 6},
-            {"code": "users", "name": "User Management", "menu_path": "/users", "menu_icon": "Shield", "menu_order": 7},
-            {"code": "roles", "name": "Role Management", "menu_path": "/roles", "menu_icon": "Shield", "menu_order": 8},
-            {"code": "api_keys", "name": "API Keys", "menu_path": "/api-keys", "menu_icon": "Key", "menu_order": 9},
-            {"code": "governance", "name": "Governance", "menu_path": "/governance", "menu_icon": "Settings", "menu_order": 10},
-        ]
-        
-        created_permissions = {}
-        for perm_data in default_permissions:
-            existing_perm = db.query(Permission).filter(Permission.code == perm_data["code"]).first()
-            if not existing_perm:
-                permission = Permission(**perm_data)
-                db.add(permission)
-                db.flush()
-                created_permissions[perm_data["code"]] = permission
-                logger.info(f"Created permission: {perm_data['name']}")
-            else:
-                created_permissions[perm_data["code"]] = existing_perm
-        
-        db.commit()
-        logger.info("Default permissions initialized successfully")
-        
-        # Initialize default roles
-        # Admin role - has all permissions
-        admin_role = db.query(Role).filter(Role.name == "admin").first()
-        if not admin_role:
-            admin_role = Role(
-                name="admin",
-                description="System administrator with full access",
-                is_system=True,
-                is_active=True
-            )
-            db.add(admin_role)
-            db.flush()
-            
-            # Assign all permissions to admin role
-            for perm in created_permissions.values():
-                role_perm = RolePermission(role_id=admin_role.id, permission_id=perm.id)
-                db.add(role_perm)
-            
-            logger.info("Created admin role with all permissions")
+        },
+        "announcement_duration": "0.25",
+        "execution_duration": "3.0",
+        "review_duration": "1.0",
+        "reward_duration": "0.0"
+    },
+    {
+        "name": "image_lora_incremental_default",
+        "description": "Default template for incremental image LoRA training",
+        "workflow_type": "image_lora_creation",
+        "workflow_spec": {
+            "theme": "manga_style",
+            "target_platform": "executor",
+            "deployment_target": "executor_node",
+            "training_mode": "incremental",
+            "dataset_spec": {
+                "source": "huggingface",
+                "repository_id": "kokoro/manga-style-dataset-v2",
+                "sample_count": 150,
+                "image_column": "image",
+                "caption_column": "text"
+            },
+            "training_spec": {
+                "base_model": "black-forest-labs/FLUX.1-dev",
+                "lora_rank": 16,
+                "lora_alpha": 32,
+                "iteration_count": 800,
+                "batch_size": 2,
+                "learning_rate": 5e-5,
+                "resolution": [512, 768]
+            }
+        },
+        "announcement_duration": "0.25",
+        "execution_duration": "3.0",
+        "review_duration": "1.0",
+        "reward_duration": "0.0"
+    },
+])
+
+_DEFAULT_PERMISSIONS = tuple(_freeze(p) for p in [
+    {"code": "dashboard", "name": "Dashboard", "menu_path": "/dashboard", "menu_icon": "LayoutDashboard", "menu_order": 1},
+    {"code": "tasks", "name": "Tasks & Workflows", "menu_path": "/tasks", "menu_icon": "ListTodo", "menu_order": 2},
+    {"code": "create_task", "name": "Create Task", "menu_path": "/create-task", "menu_icon": "PlusCircle", "menu_order": 3},
+    {"code": "task_templates", "name": "Training Templates", "menu_path": "/task-templates", "menu_icon": "FileText", "menu_order": 4},
+    {"code": "miners", "name": "Miners", "menu_path": "/miners", "menu_icon": "Users", "menu_order": 5},
+    {"code": "validators", "name": "Validators", "menu_path": "/validators", "menu_icon": "Network", "menu_order": 6},
+    {"code": "users", "name": "User Management", "menu_path": "/users", "menu_icon": "Shield", "menu_order": 7},
+    {"code": "roles", "name": "Role Management", "menu_path": "/roles", "menu_icon": "Shield", "menu_order": 8},
+    {"code": "api_keys", "name": "API Keys", "menu_path": "/api-keys", "menu_icon": "Key", "menu_order": 9},
+    {"code": "governance", "name": "Governance", "menu_path": "/governance", "menu_icon": "Settings", "menu_order": 10},
+])
+
+# Level 1: Root menus (Dashboard, Tasks & Workflows, Network, System)
+_LEVEL1_MENUS = tuple(_freeze(m) for m in [
+    {"code": "dashboard", "name": "Dashboard", "path": "/dashboard", "icon": "LayoutDashboard", "order": 1},
+    {"code": "overview", "name": "Tasks & Workflows", "path": "#", "icon": "ListTodo", "order": 2},
+    {"code": "network", "name": "Network", "path": "#", "icon": "Network", "order": 3},
+    {"code": "system", "name": "System", "path": "#", "icon": "Settings", "order": 4},
+])
+
+# Level 2: Sub-menus grouped by parent code so the seeding loop needs no
+# per-iteration parent_code lookup or dict copy/pop
+_L2_MENUS = MappingProxyType({
+    # Tasks & Workflows (Task List first, order: 1)
+    "overview": tuple(_freeze(m) for m in [
+        {"code": "tasks", "name": "Task List", "path": "/tasks", "icon": "ListTodo", "order": 1, "permission_code": "tasks"},
+        {"code": "create_task", "name": "Create Task", "path": "/create-task", "icon": "PlusCircle", "order": 2, "permission_code": "create_task"},
+        {"code": "task_templates", "name": "Training Templates", "path": "/task-templates", "icon": "FileText", "order": 3, "permission_code": "tasks"},
+    ]),
+    # Network
+    "network": tuple(_freeze(m) for m in [
+        {"code": "miners", "name": "Miners", "path": "/miners", "icon": "Users", "order": 1, "permission_code": "miners"},
+        {"code": "validators", "name": "Validators", "path": "/validators", "icon": "Network", "order": 2, "permission_code": "validators"},
+    ]),
+    # System
+    "system": tuple(_freeze(m) for m in [
+        {"code": "users", "name": "User Management", "path": "/users", "icon": "Shield", "order": 1, "permission_code": "users"},
+        {"code": "roles", "name": "Role Management", "path": "/roles", "icon": "Shield", "order": 2, "permission_code": "roles"},
+        {"code": "menus", "name": "Menu Management", "path": "/menus", "icon": "Menu", "order": 3, "permission_code": "menus"},
+        {"code": "api_keys", "name": "API Keys", "path": "/api-keys", "icon": "Key", "order": 4, "permission_code": "api_keys"},
+        {"code": "governance", "name": "Governance", "path": "/governance", "icon": "Settings", "order": 5, "permission_code": "governance"},
+    ]),
+})
+
+
+_DEFAULT_ADMIN_EMAIL = "admin@kokoro.ai"
+
+
+@functools.lru_cache(maxsize=1)
+def _default_admin_hash() -> str:
+    """Hash the default admin password once, straight through bcrypt.
+
+    Calling bcrypt directly keeps the seeding path from importing the API
+    auth module (FastAPI, jose, ...) just for its hashing wrapper.
+    """
+    return bcrypt.hashpw(b"password", bcrypt.gensalt(rounds=12)).decode()
+
+
+def init_db():
+    # Models are imported at module top (including Task below), which is enough
+    # to register them on Base.metadata; no need to re-import per call.
+    #
+    # create_all with checkfirst=True probes the catalog once per mapped table;
+    # diffing against a single get_table_names() call collapses that into one
+    # round-trip and skips DDL entirely when every table already exists.
+    existing_tables = set(inspect(engine).get_table_names())
+    missing_tables = [
+        table for table in Base.metadata.sorted_tables
+        if table.name not in existing_tables
+    ]
+    if not missing_tables:
+        logger.info("Website admin database tables already exist, skipping create_all")
+        return
+
+    Base.metadata.create_all(bind=engine, tables=missing_tables)
+    logger.info(
+        f"Website admin database tables created successfully: "
+        f"{[t.name for t in missing_tables]}"
+    )
+
+
+def _seed_templates(db):
+    # One IN query for all default names instead of one SELECT per template
+    existing_names = {
+        name
+        for (name,) in db.query(TaskTemplate.name).filter(
+            TaskTemplate.name.in_([t["name"] for t in _DEFAULT_TEMPLATES])
+        )
+    }
+    new_templates = []
+    for template_data in _DEFAULT_TEMPLATES:
+        if template_data["name"] not in existing_names:
+            new_templates.append(TaskTemplate(**_thaw(template_data)))
+            logger.info(f"Created default template: {template_data['name']}")
+
+    if new_templates:
+        db.add_all(new_templates)
+
+    logger.info("Default task templates initialized successfully")
+
+
+def _seed_permissions(db):
+    # One IN query for all default codes instead of one SELECT per permission
+    existing_by_code = {
+        p.code: p
+        for p in db.query(Permission).filter(
+            Permission.code.in_([perm["code"] for perm in _DEFAULT_PERMISSIONS])
+        )
+    }
+    created_permissions = {}
+    new_permissions = []
+    for perm_data in _DEFAULT_PERMISSIONS:
+        existing_perm = existing_by_code.get(perm_data["code"])
+        if not existing_perm:
+            permission = Permission(**perm_data)
+            new_permissions.append(permission)
+            created_permissions[perm_data["code"]] = permission
+            logger.info(f"Created permission: {perm_data['name']}")
         else:
-            # Ensure admin has all permissions
-            existing_perm_ids = {rp.permission_id for rp in admin_role.permissions}
-            for perm in created_permissions.values():
-                if perm.id not in existing_perm_ids:
-                    role_perm = RolePermission(role_id=admin_role.id, permission_id=perm.id)
-                    db.add(role_perm)
-        
-        # Viewer role - limited permissions
-        viewer_role = db.query(Role).filter(Role.name == "viewer").first()
-        if not viewer_role:
-            viewer_role = Role(
-                name="viewer",
-                description="View-only access to basic features",
-                is_system=True,
-                is_active=True
-            )
-            db.add(viewer_role)
-            db.flush()
-            
-            # Assign limited permissions to viewer role
-            viewer_permissions = ["dashboard", "tasks", "miners", "validators", "governance"]
-            for perm_code in viewer_permissions:
-                if perm_code in created_permissions:
-                    perm = created_permissions[perm_code]
-                    role_perm = RolePermission(role_id=viewer_role.id, permission_id=perm.id)
-                    db.add(role_perm)
-            
-            logger.info("Created viewer role with limited permissions")
-        
-        db.commit()
-        logger.info("Default roles initialized successfully")
-        
-        # Initialize default menus in tree structure
-        # Level 1: Root menus (Dashboard, Tasks & Workflows, Network, System)
-        level1_menus = [
-            {"code": "dashboard", "name": "Dashboard", "path": "/dashboard", "icon": "LayoutDashboard", "order": 1},
-            {"code": "overview", "name": "Tasks & Workflows", "path": "#", "icon": "ListTodo", "order": 2},
-            {"code": "network", "name": "Network", "path": "#", "icon": "Network", "order": 3},
-            {"code": "system", "name": "System", "path": "#", "icon": "Settings", "order": 4},
-        ]
-        
-        created_menus = {}
-        
-        # Create or update level 1 menus
-        for menu_data in level1_menus:
-            existing_menu = db.query(Menu).filter(Menu.code == menu_data["code"]).first()
+            created_permissions[perm_data["code"]] = existing_perm
+
+    if new_permissions:
+        # Single flush assigns ids for the whole group in one round trip
+        db.add_all(new_permissions)
+        db.flush()
+
+    logger.info("Default permissions initialized successfully")
+    return created_permissions
+
+
+def _assign_role_permissions(db, role_id, permission_ids):
+    """Insert RolePermission rows as one multi-row INSERT, skipping duplicates."""
+    rows = [{"role_id": role_id, "permission_id": pid} for pid in permission_ids]
+    if rows:
+        db.execute(
+            pg_insert(RolePermission.__table__).values(rows).on_conflict_do_nothing()
+        )
+
+
+def _seed_roles(db, created_permissions):
+    # Admin role - has all permissions
+    admin_role = db.query(Role).filter(Role.name == "admin").first()
+    if not admin_role:
+        admin_role = Role(
+            name="admin",
+            description="System administrator with full access",
+            is_system=True,
+            is_active=True
+        )
+        db.add(admin_role)
+        db.flush()
+
+        # Assign all permissions to admin role
+        _assign_role_permissions(
+            db, admin_role.id, [p.id for p in created_permissions.values()]
+        )
+
+        logger.info("Created admin role with all permissions")
+    else:
+        # Ensure admin has all permissions
+        existing_perm_ids = {rp.permission_id for rp in admin_role.permissions}
+        _assign_role_permissions(
+            db,
+            admin_role.id,
+            [p.id for p in created_permissions.values() if p.id not in existing_perm_ids]
+        )
+
+    # Viewer role - limited permissions
+    viewer_role = db.query(Role).filter(Role.name == "viewer").first()
+    if not viewer_role:
+        viewer_role = Role(
+            name="viewer",
+            description="View-only access to basic features",
+            is_system=True,
+            is_active=True
+        )
+        db.add(viewer_role)
+        db.flush()
+
+        # Assign limited permissions to viewer role
+        viewer_permissions = ["dashboard", "tasks", "miners", "validators", "governance"]
+        _assign_role_permissions(
+            db,
+            viewer_role.id,
+            [created_permissions[c].id for c in viewer_permissions if c in created_permissions]
+        )
+
+        logger.info("Created viewer role with limited permissions")
+
+    logger.info("Default roles initialized successfully")
+    return admin_role
+
+
+def _seed_menus(db):
+    # Initialize default menus in tree structure
+    created_menus = {}
+
+    # One IN query for every default menu code, both levels, instead of one
+    # SELECT per menu
+    all_codes = [m["code"] for m in _LEVEL1_MENUS]
+    for group in _L2_MENUS.values():
+        all_codes.extend(m["code"] for m in group)
+    existing_by_code = {
+        m.code: m for m in db.query(Menu).filter(Menu.code.in_(all_codes))
+    }
+
+    # Create or update level 1 menus
+    new_level1_menus = []
+    for menu_data in _LEVEL1_MENUS:
+        existing_menu = existing_by_code.get(menu_data["code"])
+        if not existing_menu:
+            menu = Menu(**menu_data)
+            new_level1_menus.append(menu)
+            created_menus[menu_data["code"]] = menu
+            logger.info(f"Created level 1 menu: {menu_data['name']}")
+        else:
+            # Update existing menu properties if changed; parent_id None turns
+            # a former child menu back into a root menu
+            desired = {
+                "name": menu_data["name"],
+                "path": menu_data["path"],
+                "order": menu_data["order"],
+                "icon": menu_data["icon"],
+                "parent_id": None,
+            }
+            updated = False
+            for field, value in desired.items():
+                if getattr(existing_menu, field) != value:
+                    setattr(existing_menu, field, value)
+                    updated = True
+            if updated:
+                logger.info(f"Updated level 1 menu: {menu_data['code']} -> {menu_data['name']}")
+            created_menus[menu_data["code"]] = existing_menu
+
+    if new_level1_menus:
+        # Single flush assigns ids for the whole group in one round trip
+        db.add_all(new_level1_menus)
+        db.flush()
+
+    # Create or update level 2 menus, one parent group at a time
+    new_level2_menus = []
+    for parent_code, group in _L2_MENUS.items():
+        parent_menu = created_menus.get(parent_code)
+        if not parent_menu:
+            continue
+        parent_id = parent_menu.id
+        for menu_data in group:
+            existing_menu = existing_by_code.get(menu_data["code"])
             if not existing_menu:
-                menu = Menu(**menu_data)
-                db.add(menu)
-                db.flush()
+                menu = Menu(parent_id=parent_id, **menu_data)
+                new_level2_menus.append(menu)
                 created_menus[menu_data["code"]] = menu
-                logger.info(f"Created level 1 menu: {menu_data['name']}")
+                logger.info(f"Created level 2 menu: {menu_data['name']} under {parent_menu.name}")
             else:
-                # Update existing menu properties if changed
-                updated = False
-                if existing_menu.name != menu_data["name"]:
-                    existing_menu.name = menu_data["name"]
-                    updated = True
-                if existing_menu.path != menu_data["path"]:
-                    existing_menu.path = menu_data["path"]
-                    updated = True
+                # Update existing menu order and name if changed
+                if existing_menu.parent_id != parent_id:
+                    existing_menu.parent_id = parent_id
+                    logger.info(f"Updated level 2 menu parent: {menu_data['code']} -> {parent_menu.name}")
                 if existing_menu.order != menu_data["order"]:
                     existing_menu.order = menu_data["order"]
-                    updated = True
-                if existing_menu.icon != menu_data["icon"]:
-                    existing_menu.icon = menu_data["icon"]
-                    updated = True
-                # If this was a child menu, make it a root menu
-                if existing_menu.parent_id is not None:
-                    existing_menu.parent_id = None
-                    updated = True
-                if updated:
-                    logger.info(f"Updated level 1 menu: {menu_data['code']} -> {menu_data['name']}")
-                created_menus[menu_data["code"]] = existing_menu
-        
-        db.commit()
-        
-        # Level 2: Sub-menus under Tasks & Workflows
-        # First menu should be Task List (order: 1)
-        overview_menus = [
-            {"code": "tasks", "name": "Task List", "path": "/tasks", "icon": "ListTodo", "order": 1, "permission_code": "tasks", "parent_code": "overview"},
-            {"code": "create_task", "name": "Create Task", "path": "/create-task", "icon": "PlusCircle", "order": 2, "permission_code": "create_task", "parent_code": "overview"},
-            {"code": "task_templates", "name": "Training Templates", "path": "/task-templates", "icon": "FileText", "order": 3, "permission_code": "tasks", "parent_code": "overview"},
-        ]
-        
-        # Level 2: Sub-menus under Network
-        network_menus = [
-            {"code": "miners", "name": "Miners", "path": "/miners", "icon": "Users", "order": 1, "permission_code": "miners", "parent_code": "network"},
-            {"code": "validators", "name": "Validators", "path": "/validators", "icon": "Network", "order": 2, "permission_code": "validators", "parent_code": "network"},
-        ]
-        
-        # Level 2: Sub-menus under System
-        system_menus = [
-            {"code": "users", "name": "User Management", "path": "/users", "icon": "Shield", "order": 1, "permission_code": "users", "parent_code": "system"},
-            {"code": "roles", "name": "Role Management", "path": "/roles", "icon": "Shield", "order": 2, "permission_code": "roles", "parent_code": "system"},
-            {"code": "menus", "name": "Menu Management", "path": "/menus", "icon": "Menu", "order": 3, "permission_code": "menus", "parent_code": "system"},
-            {"code": "api_keys", "name": "API Keys", "path": "/api-keys", "icon": "Key", "order": 4, "permission_code": "api_keys", "parent_code": "system"},
-            {"code": "governance", "name": "Governance", "path": "/governance", "icon": "Settings", "order": 5, "permission_code": "governance", "parent_code": "system"},
-        ]
-        
-        # Create or update level 2 menus
-        all_level2_menus = overview_menus + network_menus + system_menus
-        for menu_data in all_level2_menus:
-            parent_code = menu_data.get("parent_code")
-            existing_menu = db.query(Menu).filter(Menu.code == menu_data["code"]).first()
-            if not existing_menu:
-                parent_menu = created_menus.get(parent_code)
-                if parent_menu:
-                    menu_data_copy = menu_data.copy()
-                    menu_data_copy.pop("parent_code")
-                    menu_data_copy["parent_id"] = parent_menu.id
-                    menu = Menu(**menu_data_copy)
-                    db.add(menu)
-                    db.flush()
-                    created_menus[menu_data["code"]] = menu
-                    logger.info(f"Created level 2 menu: {menu_data['name']} under {parent_menu.name}")
-            else:
-                # Update existing menu order and name if changed
-                parent_menu = created_menus.get(parent_code)
-                if parent_menu:
-                    if existing_menu.parent_id != parent_menu.id:
-                        existing_menu.parent_id = parent_menu.id
-                        logger.info(f"Updated level 2 menu parent: {menu_data['code']} -> {parent_menu.name}")
-                    if existing_menu.order != menu_data["order"]:
-                        existing_menu.order = menu_data["order"]
-                        logger.info(f"Updated level 2 menu order: {menu_data['code']} -> {menu_data['order']}")
-                    if existing_menu.name != menu_data["name"]:
-                        existing_menu.name = menu_data["name"]
-                        logger.info(f"Updated level 2 menu name: {menu_data['code']} -> {menu_data['name']}")
+                    logger.info(f"Updated level 2 menu order: {menu_data['code']} -> {menu_data['order']}")
+                if existing_menu.name != menu_data["name"]:
+                    existing_menu.name = menu_data["name"]
+                    logger.info(f"Updated level 2 menu name: {menu_data['code']} -> {menu_data['name']}")
                 created_menus[menu_data["code"]] = existing_menu
-        
-        db.commit()
-        
-        # Remove Dashboard from Tasks & Workflows if it exists as a child menu
-        # (Dashboard is now a level 1 menu)
-        dashboard_as_child = db.query(Menu).filter(
-            Menu.code == "dashboard",
-            Menu.parent_id.isnot(None)
-        ).first()
-        if dashboard_as_child:
-            # Delete the child dashboard menu if it exists
-            db.delete(dashboard_as_child)
-            db.commit()
-            logger.info("Removed Dashboard from Tasks & Workflows (now a level 1 menu)")
-        
-        logger.info("Default menus initialized successfully")
-        
-        # Create default admin user if not exists
-        admin_user = db.query(User).filter(User.email == "admin@kokoro.ai").first()
-        if not admin_user:
-            admin_user = User(
-                email="admin@kokoro.ai",
-                username="admin",
-                hashed_password=get_password_hash("password"),
-                role_id=admin_role.id,
-                is_active=True
-            )
-            db.add(admin_user)
-            db.commit()
-            logger.info("Default admin user created: admin@kokoro.ai / password")
-        
+
+    if new_level2_menus:
+        db.add_all(new_level2_menus)
+        db.flush()
+
+    # Remove Dashboard from Tasks & Workflows if it exists as a child menu
+    # (Dashboard is now a level 1 menu) - single DELETE, no row materialization
+    result = db.execute(
+        delete(Menu).where(Menu.code == "dashboard", Menu.parent_id.isnot(None))
+    )
+    if result.rowcount > 0:
+        logger.info("Removed Dashboard from Tasks & Workflows (now a level 1 menu)")
+
+    logger.info("Default menus initialized successfully")
+
+
+def _seed_admin(db, admin_role):
+    # Create default admin user if not exists
+    admin_user = db.query(User).filter(User.email == _DEFAULT_ADMIN_EMAIL).first()
+    if not admin_user:
+        admin_user = User(
+            email=_DEFAULT_ADMIN_EMAIL,
+            username="admin",
+            hashed_password=_default_admin_hash(),
+            role_id=admin_role.id,
+            is_active=True
+        )
+        db.add(admin_user)
+        logger.info(f"Default admin user created: {_DEFAULT_ADMIN_EMAIL} / password")
+
+
+def init_data():
+    # Warm the bcrypt hash cache outside the transaction so no connection is
+    # held during the KDF (only needed when the admin user is missing).
+    with SessionLocal() as probe:
+        admin_missing = probe.query(User).filter(
+            User.email == _DEFAULT_ADMIN_EMAIL
+        ).first() is None
+    if admin_missing:
+        _default_admin_hash()
+
+    try:
+        # begin() commits on success and rolls back on error, so the connection
+        # is held only for the duration of the seeding itself
+        with SessionLocal.begin() as db:
+            _seed_templates(db)
+            created_permissions = _seed_permissions(db)
+            admin_role = _seed_roles(db, created_permissions)
+            _seed_menus(db)
+            _seed_admin(db, admin_role)
     except Exception as e:
         logger.error(f"Failed to initialize default data: {e}")
-        db.rollback()
         raise
-    finally:
-        db.close()
 
 
 if __name__ == "__main__":
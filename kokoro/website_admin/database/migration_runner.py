@@ -2,15 +2,28 @@
 Database migration system for website_admin module.
 Automatically executes SQL migration scripts on service startup.
 """
+import asyncio
 import os
 import re
 from pathlib import Path
-from sqlalchemy import text
+from sqlalchemy import event, text
 from kokoro.common.database import engine
 from kokoro.common.utils.logging import setup_logger
 
 logger = setup_logger(__name__)
 
+
+@event.listens_for(engine, "connect")
+def _disable_prepared_statements(dbapi_conn, connection_record):
+    """Turn off driver-side prepared-statement caching for migration connections.
+
+    Each migration is a unique DDL string, so preparing it only adds a plan
+    round trip. psycopg2 has no statement cache, making this a no-op there;
+    psycopg3 connections expose prepare_threshold.
+    """
+    if hasattr(dbapi_conn, "prepare_threshold"):
+        dbapi_conn.prepare_threshold = None
+
 # Migration scripts directory
 MIGRATIONS_DIR = Path(__file__).parent / "migrations"
 
@@ -73,58 +86,136 @@ def mark_migration_executed(version, filename, conn):
         raise
 
 
-def execute_migration(version, file_path):
-    """Execute a single migration file."""
-    logger.info(f"Executing migration {version}: {file_path.name}")
-    
+def _execute_migration_sql(version, file_path, sql_content, conn):
+    """Execute already-read migration SQL on an open connection."""
     try:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            sql_content = f.read()
-        
         if not sql_content.strip():
             logger.warning(f"Migration {version} is empty, skipping")
             return
-        
+
         logger.debug(f"Migration {version} SQL content:\n{sql_content}")
-        
-        with engine.begin() as conn:  # Use begin() for automatic transaction management
-            # Execute the entire migration SQL file
-            # PostgreSQL supports executing multiple statements in one call
-            result = conn.execute(text(sql_content))
-            logger.debug(f"Migration {version} SQL executed, affected rows: {result.rowcount if hasattr(result, 'rowcount') else 'N/A'}")
-            
-            # Mark migration as executed
-            mark_migration_executed(version, file_path.name, conn)
-            logger.info(f"Migration {version} executed successfully")
-            
+
+        # Execute the entire migration SQL file
+        # PostgreSQL supports executing multiple statements in one call
+        result = conn.execute(text(sql_content))
+        logger.debug(f"Migration {version} SQL executed, affected rows: {result.rowcount if hasattr(result, 'rowcount') else 'N/A'}")
+
+        # Mark migration as executed
+        mark_migration_executed(version, file_path.name, conn)
+        logger.info(f"Migration {version} executed successfully")
+
     except Exception as e:
         logger.error(f"Failed to execute migration {version} ({file_path.name}): {e}", exc_info=True)
         raise
 
 
+def execute_migration(version, file_path):
+    """Execute a single migration file in its own transaction."""
+    logger.info(f"Executing migration {version}: {file_path.name}")
+    with engine.begin() as conn:
+        _execute_migration_sql(version, file_path, file_path.read_text(encoding='utf-8'), conn)
+
+
+def _schema_is_current(conn):
+    """Heuristic for a fresh install whose schema create_all already built.
+
+    The avatar column only exists if either the whole migration chain ran
+    (in which case schema_migrations is populated) or create_all built the
+    tables from current models. When no migration has been recorded but the
+    column is present, replaying the chain would be pure no-op DDL.
+    """
+    return bool(conn.execute(text("""
+        SELECT EXISTS (
+            SELECT FROM information_schema.columns
+            WHERE table_name = 'users' AND column_name = 'avatar'
+        )
+    """)).scalar())
+
+
+def _stamp_migrations(pending_migrations, conn):
+    """Record pending migrations as executed without running their SQL."""
+    for version, file_path in pending_migrations:
+        mark_migration_executed(version, file_path.name, conn)
+    logger.info(f"Stamped {len(pending_migrations)} migration(s) on current schema")
+
+
+def _get_pending_migrations(executed_versions):
+    return [
+        (version, file_path)
+        for version, file_path in get_migration_files()
+        if version not in executed_versions
+    ]
+
+
 def run_migrations():
-    """Run all pending migrations."""
+    """Run all pending migrations atomically.
+
+    On a clean install where create_all already built the current schema,
+    the chain is stamped instead of replayed; otherwise every pending
+    migration runs inside one transaction (one commit, all-or-nothing).
+    """
     try:
         executed_versions = get_executed_migrations()
-        migration_files = get_migration_files()
-        
-        pending_migrations = [
-            (version, file_path) 
-            for version, file_path in migration_files 
-            if version not in executed_versions
-        ]
-        
+        pending_migrations = _get_pending_migrations(executed_versions)
+
         if not pending_migrations:
             logger.info("No pending migrations found")
             return
-        
+
+        logger.info(f"Found {len(pending_migrations)} pending migration(s)")
+
+        with engine.begin() as conn:
+            if not executed_versions and _schema_is_current(conn):
+                _stamp_migrations(pending_migrations, conn)
+                return
+            for version, file_path in pending_migrations:
+                logger.info(f"Executing migration {version}: {file_path.name}")
+                _execute_migration_sql(
+                    version, file_path, file_path.read_text(encoding='utf-8'), conn
+                )
+
+        logger.info("All migrations completed successfully")
+
+    except Exception as e:
+        logger.error(f"Migration failed: {e}")
+        raise
+
+
+async def run_migrations_async():
+    """Run all pending migrations without blocking the event loop.
+
+    Migration files are read from disk concurrently, then the whole chain is
+    applied in a worker thread with the same stamp/one-transaction semantics
+    as run_migrations().
+    """
+    try:
+        executed_versions = await asyncio.to_thread(get_executed_migrations)
+        pending_migrations = _get_pending_migrations(executed_versions)
+
+        if not pending_migrations:
+            logger.info("No pending migrations found")
+            return
+
         logger.info(f"Found {len(pending_migrations)} pending migration(s)")
-        
-        for version, file_path in pending_migrations:
-            execute_migration(version, file_path)
-        
+
+        contents = await asyncio.gather(*(
+            asyncio.to_thread(file_path.read_text, encoding='utf-8')
+            for _, file_path in pending_migrations
+        ))
+
+        def _apply_all():
+            with engine.begin() as conn:
+                if not executed_versions and _schema_is_current(conn):
+                    _stamp_migrations(pending_migrations, conn)
+                    return
+                for (version, file_path), sql_content in zip(pending_migrations, contents):
+                    logger.info(f"Executing migration {version}: {file_path.name}")
+                    _execute_migration_sql(version, file_path, sql_content, conn)
+
+        await asyncio.to_thread(_apply_all)
+
         logger.info("All migrations completed successfully")
-        
+
     except Exception as e:
         logger.error(f"Migration failed: {e}")
         raise
@@ -1,104 +1,283 @@
+import asyncio
+import logging
 import os
+from contextlib import asynccontextmanager
+
+import orjson
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
-from kokoro.website_admin.api import router
+from fastapi.responses import ORJSONResponse
+from starlette.routing import Route
 from kokoro.common.utils.logging import setup_logger
-from kokoro.common.config.yaml_config import YamlConfig
-from kokoro.common.config import settings
-from kokoro.common.database.base import Base
-from kokoro.common.database import engine
 
 logger = setup_logger(__name__)
 
-app = FastAPI(title="KOKORO Website Admin", version="1.0.0")
-
-# Add CORS middleware
-app.add_middleware(
-    CORSMiddleware,
-    allow_origins=["*"],  # In production, specify exact origins
-    allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
+# Add module prefix to logger. Built once and handlers tagged so repeated
+# imports (reloaders, tests) don't re-compile the format string or re-wrap
+# already-configured handlers.
+_LOG_FORMATTER = logging.Formatter(
+    '%(asctime)s - [WEBSITE_ADMIN] - %(name)s - %(levelname)s - %(message)s'
 )
+for handler in logger.handlers:
+    if not getattr(handler, "_kokoro_formatted", False):
+        handler.setFormatter(_LOG_FORMATTER)
+        handler._kokoro_formatted = True
+# Records are fully handled here; don't duplicate them through the root logger
+logger.propagate = False
 
-app.include_router(router, prefix="/v1")
+# Set once the startup phases have finished; /health reports "initializing" until then
+_startup_complete = asyncio.Event()
 
-# Load configuration
-config_path = os.getenv("WEBSITE_ADMIN_CONFIG", "config.yml")
-yaml_config = None
-if os.path.exists(config_path):
-    try:
-        yaml_config = YamlConfig(config_path)
-        logger.info(f"Config loaded from: {config_path}")
-    except Exception as e:
-        logger.warning(f"Failed to load config: {e}")
-
-# Configure database URL from config file if provided
-if yaml_config:
-    database_url = yaml_config.get('database.url', settings.DATABASE_URL)
-else:
-    database_url = settings.DATABASE_URL
-
-# Update engine URL if different from default
-if database_url != settings.DATABASE_URL:
-    from kokoro.common.database.session import engine
-    # Update engine URL (similar to task_center_main.py)
-    engine.url = database_url
-    logger.info(f"Database URL configured from config file: {database_url}")
-else:
-    logger.info(f"Using default database URL: {database_url}")
-
-# Import all models to ensure they are registered with SQLAlchemy
-from kokoro.website_admin.models import TaskTemplate, TaskHistory, OperationLog, User
-from kokoro.website_admin.models.role import Role, Permission, RolePermission
-# Import Task model to ensure it's registered
-from kokoro.common.models.task import Task
-
-# Create all database tables on startup
-# This will create tables if they don't exist, but won't modify existing tables
-Base.metadata.create_all(bind=engine)
-logger.info("Database tables checked/created successfully")
-
-@app.on_event("startup")
-async def startup_event():
+# Advisory lock key so only one worker seeds default data in multi-worker deployments
+_INIT_DATA_LOCK_KEY = 0x6B6F6B6F  # "koko"
+
+
+def _asgi_headers(body: bytes) -> list:
+    """Pre-built raw ASGI headers for a static JSON body."""
+    return [
+        (b"content-type", b"application/json"),
+        (b"content-length", str(len(body)).encode()),
+    ]
+
+
+def _load_config(config_path=None):
+    """Load the service YAML config, returning None when absent or invalid."""
+    from kokoro.common.config.yaml_config import YamlConfig
+
+    config_path = config_path or os.getenv("WEBSITE_ADMIN_CONFIG", "config.yml")
+    if os.path.exists(config_path):
+        try:
+            yaml_config = YamlConfig(config_path)
+            logger.info(f"Config loaded from: {config_path}")
+            return yaml_config
+        except Exception as e:
+            logger.warning(f"Failed to load config: {e}")
+    return None
+
+
+def _configure_database_url(yaml_config):
+    """Point the shared engine at the configured database URL if overridden."""
+    from kokoro.common.config import settings
+
+    if yaml_config:
+        database_url = yaml_config.get('database.url', settings.DATABASE_URL)
+    else:
+        database_url = settings.DATABASE_URL
+
+    if database_url != settings.DATABASE_URL:
+        from kokoro.common.database.session import engine
+        # Update engine URL (similar to task_center_main.py)
+        engine.url = database_url
+        logger.info(f"Database URL configured from config file: {database_url}")
+    else:
+        logger.info(f"Using default database URL: {database_url}")
+
+
+def _run_init_data_locked():
+    """Run init_data() under a Postgres advisory lock to avoid multi-worker races."""
+    from sqlalchemy import text
+    from kokoro.common.database import engine
+    from kokoro.website_admin.database import init_data
+
+    with engine.connect() as conn:
+        locked = conn.execute(
+            text("SELECT pg_try_advisory_lock(:key)"), {"key": _INIT_DATA_LOCK_KEY}
+        ).scalar()
+        if not locked:
+            logger.info("Another worker is initializing default data, skipping")
+            return
+        try:
+            init_data()
+        finally:
+            conn.execute(
+                text("SELECT pg_advisory_unlock(:key)"), {"key": _INIT_DATA_LOCK_KEY}
+            )
+
+
+def _ensure_avatar_column():
+    """Ensure the users.avatar column exists, remembering success across boots.
+
+    Once the column has been verified, a row in schema_flags lets every later
+    startup get away with a single-row SELECT instead of inspecting the users
+    table again.
+    """
+    from sqlalchemy import text
+    from kokoro.common.database import engine
+
+    with engine.begin() as conn:
+        conn.execute(text(
+            "CREATE TABLE IF NOT EXISTS schema_flags ("
+            "key VARCHAR(64) PRIMARY KEY, value VARCHAR(255))"
+        ))
+        verified = conn.execute(text(
+            "SELECT 1 FROM schema_flags WHERE key = 'avatar_column_ok'"
+        )).scalar()
+        if verified:
+            return
+        # Targeted catalog lookup instead of SQLAlchemy reflection: the
+        # inspector pulls full table metadata when all we need is existence
+        users_exists = conn.execute(text(
+            "SELECT 1 FROM information_schema.tables WHERE table_name = 'users'"
+        )).scalar()
+        if users_exists:
+            conn.execute(text("ALTER TABLE users ADD COLUMN IF NOT EXISTS avatar VARCHAR(255)"))
+            conn.execute(text(
+                "INSERT INTO schema_flags (key, value) VALUES ('avatar_column_ok', '1') "
+                "ON CONFLICT (key) DO NOTHING"
+            ))
+
+
+def _warm_connection():
+    """Check out one pooled connection and ping it."""
+    from sqlalchemy import text
+    from kokoro.common.database import engine
+
+    with engine.connect() as conn:
+        conn.execute(text("SELECT 1"))
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
     """Initialize database, run migrations, and default data on startup."""
     logger.info("Website Admin service starting up")
-    from kokoro.website_admin.database import init_db, init_data, run_migrations
-    
+    from kokoro.website_admin.database import init_db, run_migrations_async
+
     try:
-        # Ensure all database tables are created (including tasks table)
+        # Ensure all database tables are created first (including tasks table).
+        # Run off the event loop so /health can respond while init proceeds.
         logger.info("Initializing database tables...")
-        init_db()
+        await asyncio.to_thread(init_db)
         logger.info("Database tables initialization completed")
     except Exception as e:
         logger.error(f"Failed to initialize database tables: {e}")
         # Don't raise - allow service to start even if init fails
         # But log the error for debugging
-    
-    try:
-        # Run database migrations
-        logger.info("Running database migrations...")
-        run_migrations()
-        logger.info("Database migrations completed")
-    except Exception as e:
-        logger.error(f"Failed to run migrations: {e}")
+
+    # Migrations and default data are independent once tables exist; run both
+    # concurrently in worker threads instead of serially on the event loop.
+    migrations_result, init_data_result = await asyncio.gather(
+        run_migrations_async(),
+        asyncio.to_thread(_run_init_data_locked),
+        return_exceptions=True
+    )
+    if isinstance(migrations_result, Exception):
+        logger.error(f"Failed to run migrations: {migrations_result}")
         # Don't raise - allow service to start even if migrations fail
-        # But log the error for debugging
-    
-    try:
-        # Initialize default data (templates and admin user)
-        # This function checks if data already exists before creating
-        init_data()
-        logger.info("Default data initialization completed")
-    except Exception as e:
-        logger.warning(f"Failed to initialize default data: {e}")
+    else:
+        logger.info("Database migrations completed")
+
+    if isinstance(init_data_result, Exception):
+        logger.warning(f"Failed to initialize default data: {init_data_result}")
         # Don't raise - allow service to start even if init fails
+    else:
+        logger.info("Default data initialization completed")
+
+    # The remaining steps are independent of each other: verifying the avatar
+    # column, warming the pool (concurrent checkouts force real connections
+    # open) and pre-building the OpenAPI schema. Run them all concurrently so
+    # this phase costs the slowest step, not the sum.
+    warm_count = int(os.getenv("WEBSITE_ADMIN_POOL_WARM", "5"))
+    post_steps = [
+        asyncio.to_thread(_ensure_avatar_column),
+        *(asyncio.to_thread(_warm_connection) for _ in range(warm_count)),
+    ]
+    if app.openapi_url:
+        post_steps.append(asyncio.to_thread(app.openapi))
+    results = await asyncio.gather(*post_steps, return_exceptions=True)
+
+    if isinstance(results[0], Exception):
+        logger.error(f"Failed to verify/add avatar column: {results[0]}")
+    else:
+        logger.info("Avatar column ensured on users table")
+
+    warm_errors = [r for r in results[1:1 + warm_count] if isinstance(r, Exception)]
+    if warm_errors:
+        logger.warning(f"Failed to warm connection pool: {warm_errors[0]}")
+    else:
+        logger.info(f"Connection pool warmed with {warm_count} connections")
+
+    _startup_complete.set()
+    yield
+
+
+def create_app(config_path: str | None = None) -> FastAPI:
+    """Build the website admin application.
+
+    All side effects — config load, engine URL override, router import and
+    route registration — happen here instead of at module import, so tests
+    and tooling can import this module without touching the database stack.
+    """
+    from kokoro.website_admin.api import router
+
+    yaml_config = _load_config(config_path)
+    _configure_database_url(yaml_config)
+
+    # Docs are disabled in production; this is an internal admin API and the
+    # schema walk costs memory and a first-request latency spike
+    is_prod = os.getenv("WEBSITE_ADMIN_ENV") == "prod"
+
+    app = FastAPI(
+        title="KOKORO Website Admin",
+        version="1.0.0",
+        lifespan=lifespan,
+        default_response_class=ORJSONResponse,
+        openapi_url=None if is_prod else "/openapi.json",
+        docs_url=None if is_prod else "/docs",
+        redoc_url=None if is_prod else "/redoc",
+    )
+
+    # CORS allow-lists come from config when present; explicit lists let the
+    # middleware do set-membership checks instead of wildcard handling per request
+    cors_origins = (yaml_config.get('cors.allowed_origins') if yaml_config else None) or ["*"]
+    cors_methods = (yaml_config.get('cors.allowed_methods') if yaml_config else None) or ["*"]
+    cors_headers = (yaml_config.get('cors.allowed_headers') if yaml_config else None) or ["*"]
+
+    app.add_middleware(
+        CORSMiddleware,
+        allow_origins=cors_origins,
+        # Credentials plus a wildcard origin is disallowed by the CORS spec;
+        # only enable them once an explicit origin list is configured
+        allow_credentials="*" not in cors_origins,
+        allow_methods=cors_methods,
+        allow_headers=cors_headers,
+    )
+
+    app.include_router(router, prefix="/v1")
+
+    # Health payloads and headers pre-encoded once; probes hit this endpoint
+    # every few seconds per replica, so steady state serves static bytes. The
+    # endpoint is a raw ASGI callable mounted ahead of the FastAPI routes —
+    # probes skip dependency resolution and response-model machinery entirely
+    # and cost two ASGI sends.
+    health_ok = orjson.dumps({"status": "ok", "config_loaded": yaml_config is not None})
+    health_initializing = orjson.dumps(
+        {"status": "initializing", "config_loaded": yaml_config is not None}
+    )
+
+    class _HealthEndpoint:
+        """ASGI health endpoint; a class instance so Route mounts it as-is."""
+
+        _responses = {
+            True: (health_ok, _asgi_headers(health_ok)),
+            False: (health_initializing, _asgi_headers(health_initializing)),
+        }
+
+        async def __call__(self, scope, receive, send):
+            body, headers = self._responses[_startup_complete.is_set()]
+            await send({"type": "http.response.start", "status": 200, "headers": headers})
+            await send({"type": "http.response.body", "body": body})
+
+    app.router.routes.insert(0, Route("/health", endpoint=_HealthEndpoint()))
+
+    return app
 
-@app.get("/health")
-async def health_check():
-    """Health check endpoint."""
-    return {
-        "status": "ok",
-        "config_loaded": yaml_config is not None
-    }
 
+def __getattr__(name):
+    # PEP 562: build the app lazily on first attribute access, so
+    # `uvicorn kokoro.website_admin.main:app` keeps working while a plain
+    # import of this module stays side-effect free.
+    if name == "app":
+        application = create_app()
+        globals()["app"] = application
+        return application
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,15 +1,19 @@
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter
 from typing import Optional
 from datetime import datetime
 
 
 class ApiKeyCreate(BaseModel):
+    model_config = ConfigDict(extra="forbid")
+
     name: str = Field(..., description="API key name")
     description: Optional[str] = Field(None, description="API key description")
     expires_at: Optional[datetime] = Field(None, description="Expiration date")
 
 
 class ApiKeyUpdate(BaseModel):
+    model_config = ConfigDict(extra="forbid")
+
     name: Optional[str] = Field(None, description="API key name")
     description: Optional[str] = Field(None, description="API key description")
     is_active: Optional[bool] = Field(None, description="Whether the key is active")
@@ -17,6 +21,8 @@ class ApiKeyUpdate(BaseModel):
 
 
 class ApiKeyResponse(BaseModel):
+    model_config = ConfigDict(from_attributes=True, frozen=True)
+
     id: int
     name: str
     key: str
@@ -28,8 +34,10 @@ class ApiKeyResponse(BaseModel):
     created_at: datetime
     updated_at: Optional[datetime]
 
-    class Config:
-        from_attributes = True
+
+# Pre-compiled batch validator: one pydantic-core loop instead of a Python-level
+# ApiKeyResponse construction per row
+ApiKeyResponseListAdapter = TypeAdapter(list[ApiKeyResponse])
 
 
 class ApiKeyListResponse(BaseModel):
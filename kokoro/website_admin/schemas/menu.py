@@ -1,49 +1,53 @@
-from pydantic import BaseModel, Field
-from typing import Optional, List
+from __future__ import annotations
+
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter
 from datetime import datetime
 
+from kokoro.website_admin.schemas.partial import partial_model
+
 
 class MenuBase(BaseModel):
     name: str = Field(..., description="Menu display name")
     code: str = Field(..., description="Menu code (unique identifier)")
     path: str = Field(..., description="Menu route path")
-    icon: Optional[str] = Field(None, description="Icon name from lucide-react")
-    parent_id: Optional[int] = Field(None, description="Parent menu ID")
-    category: Optional[str] = Field(None, description="Menu category")
+    icon: str | None = Field(None, description="Icon name from lucide-react")
+    parent_id: int | None = Field(None, description="Parent menu ID")
+    category: str | None = Field(None, description="Menu category")
     order: int = Field(0, description="Display order")
     is_active: bool = Field(True, description="Whether the menu is active")
-    permission_code: Optional[str] = Field(None, description="Required permission code")
-    description: Optional[str] = Field(None, description="Menu description")
+    permission_code: str | None = Field(None, description="Required permission code")
+    description: str | None = Field(None, description="Menu description")
 
 
 class MenuCreate(MenuBase):
     pass
 
 
-class MenuUpdate(BaseModel):
-    name: Optional[str] = None
-    code: Optional[str] = None
-    path: Optional[str] = None
-    icon: Optional[str] = None
-    parent_id: Optional[int] = None
-    category: Optional[str] = None
-    order: Optional[int] = None
-    is_active: Optional[bool] = None
-    permission_code: Optional[str] = None
-    description: Optional[str] = None
+# All MenuBase fields, optional for PATCH semantics
+MenuUpdate = partial_model("MenuUpdate", MenuBase)
 
 
 class MenuResponse(MenuBase):
     id: int
-    created_at: Optional[datetime] = None
-    updated_at: Optional[datetime] = None
-    has_children: Optional[bool] = None  # Indicates if menu has children (for lazy loading)
-    
-    class Config:
-        from_attributes = True
+    created_at: datetime | None = None
+    updated_at: datetime | None = None
+    has_children: bool | None = None  # Indicates if menu has children (for lazy loading)
+
+    model_config = ConfigDict(from_attributes=True)
+
+
+# Built once at import; re-creating a TypeAdapter per call rebuilds the validator
+_MENU_LIST_ADAPTER = TypeAdapter(list[MenuResponse])
 
 
 class MenuListResponse(BaseModel):
-    menus: List[MenuResponse]
+    menus: list[MenuResponse]
     total: int
 
+    @classmethod
+    def validate_rows(cls, rows, total: int) -> "MenuListResponse":
+        """Batch-validate rows through the pre-compiled list adapter."""
+        return cls.model_construct(
+            menus=_MENU_LIST_ADAPTER.validate_python(rows, from_attributes=True),
+            total=total,
+        )
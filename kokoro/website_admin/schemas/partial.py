@@ -0,0 +1,21 @@
+from pydantic import BaseModel, create_model
+from typing import Optional, Type
+
+
+def partial_model(name: str, base: Type[BaseModel], exclude: tuple = (), **extra_fields) -> Type[BaseModel]:
+    """Build a PATCH variant of a schema: every base field optional, defaulting to None.
+
+    Declaring update models this way keeps the field list in one place and
+    avoids a second hand-written block of ~10 Optional declarations per
+    schema, which pydantic would otherwise build separately.
+
+    Extra fields not present on the base are passed as ``name=(type, default)``
+    keyword arguments, in ``create_model`` form.
+    """
+    fields = {
+        field_name: (Optional[field.annotation], None)
+        for field_name, field in base.model_fields.items()
+        if field_name not in exclude
+    }
+    fields.update(extra_fields)
+    return create_model(name, **fields)
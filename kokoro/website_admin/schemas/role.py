@@ -1,16 +1,19 @@
-from pydantic import BaseModel
-from typing import Optional, List
+from __future__ import annotations
+
+from pydantic import BaseModel, ConfigDict
 from datetime import datetime
 
+from kokoro.website_admin.schemas.partial import partial_model
+
 
 class PermissionBase(BaseModel):
     code: str
     name: str
-    description: Optional[str] = None
-    menu_path: Optional[str] = None
-    menu_icon: Optional[str] = None
+    description: str | None = None
+    menu_path: str | None = None
+    menu_icon: str | None = None
     menu_order: int = 0
-    parent_id: Optional[int] = None
+    parent_id: int | None = None
 
 
 class PermissionCreate(PermissionBase):
@@ -20,57 +23,40 @@ class PermissionCreate(PermissionBase):
 class PermissionResponse(PermissionBase):
     id: int
     is_active: bool
-    created_at: Optional[datetime] = None
-
-    class Config:
-        from_attributes = True
-        
-    @classmethod
-    def from_orm(cls, obj):
-        """Create from ORM object."""
-        return cls(
-            id=obj.id,
-            code=obj.code,
-            name=obj.name,
-            description=obj.description,
-            menu_path=obj.menu_path,
-            menu_icon=obj.menu_icon,
-            menu_order=obj.menu_order,
-            parent_id=obj.parent_id,
-            is_active=obj.is_active,
-            created_at=obj.created_at
-        )
+    created_at: datetime | None = None
+
+    model_config = ConfigDict(from_attributes=True)
 
 
 class RoleBase(BaseModel):
     name: str
-    description: Optional[str] = None
+    description: str | None = None
 
 
 class RoleCreate(RoleBase):
-    permission_ids: List[int] = []
+    permission_ids: list[int] = []
 
 
-class RoleUpdate(BaseModel):
-    name: Optional[str] = None
-    description: Optional[str] = None
-    permission_ids: Optional[List[int]] = None
-    is_active: Optional[bool] = None
+# RoleBase fields plus the PATCH-only ones, all optional
+RoleUpdate = partial_model(
+    "RoleUpdate",
+    RoleBase,
+    permission_ids=(list[int] | None, None),
+    is_active=(bool | None, None),
+)
 
 
 class RoleResponse(RoleBase):
     id: int
     is_system: bool
     is_active: bool
-    permissions: List[PermissionResponse] = []
-    user_count: Optional[int] = None
-    created_at: Optional[datetime] = None
+    permissions: list[PermissionResponse] = []
+    user_count: int | None = None
+    created_at: datetime | None = None
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class RoleListResponse(BaseModel):
-    roles: List[RoleResponse]
+    roles: list[RoleResponse]
     total: int
-
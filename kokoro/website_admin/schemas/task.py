@@ -1,5 +1,7 @@
+from __future__ import annotations
+
 from pydantic import BaseModel, Field
-from typing import Optional, Dict, Any, List
+from typing import Any, Literal
 from datetime import datetime
 
 
@@ -7,11 +9,21 @@ class DatasetSpec(BaseModel):
     source: str = "huggingface"
     repository_id: str
     sample_count: int
-    data_format: Optional[str] = "jsonl"
-    question_column: Optional[str] = None
-    answer_column: Optional[str] = None
-    image_column: Optional[str] = None
-    caption_column: Optional[str] = None
+
+
+class TextDatasetSpec(DatasetSpec):
+    # Defaulted tag so payloads from older clients (no modality key) still
+    # validate through the smart union below
+    modality: Literal["text"] = "text"
+    data_format: str | None = "jsonl"
+    question_column: str
+    answer_column: str
+
+
+class ImageDatasetSpec(DatasetSpec):
+    modality: Literal["image"] = "image"
+    image_column: str
+    caption_column: str
 
 
 class TrainingSpec(BaseModel):
@@ -21,31 +33,31 @@ class TrainingSpec(BaseModel):
     iteration_count: int = 1000
     batch_size: int = 4
     learning_rate: float = 2e-4
-    max_length: Optional[int] = 512
-    resolution: Optional[List[int]] = None
+    max_length: int | None = 512
+    resolution: list[int] | None = None
 
 
 class WorkflowSpec(BaseModel):
     theme: str
     target_platform: str
     deployment_target: str
-    training_mode: str = Field(..., description="new or incremental")
-    dataset_spec: DatasetSpec
+    training_mode: Literal["new", "incremental"]
+    dataset_spec: TextDatasetSpec | ImageDatasetSpec
     training_spec: TrainingSpec
-    base_lora_url: Optional[str] = None
+    base_lora_url: str | None = None
 
 
 class TaskPublishRequest(BaseModel):
-    task_id: Optional[str] = None  # User-defined task ID
+    task_id: str | None = None  # User-defined task ID
     workflow_id: str
-    workflow_type: str = Field(..., description="text_lora_creation or image_lora_creation")
+    workflow_type: Literal["text_lora_creation", "image_lora_creation"]
     workflow_spec: WorkflowSpec
-    publish_status: Optional[str] = "draft"  # 草稿/已发布，默认草稿
-    start_date: Optional[datetime] = None  # Start Date
-    end_date: Optional[datetime] = None  # End Date
-    description: Optional[str] = None  # 描述
-    hf_dataset_url: Optional[str] = None  # 训练数据集HF的URL
-    pdf_file_url: Optional[str] = None  # PDF任务文件URL
+    publish_status: Literal["draft", "published"] | None = "draft"  # 草稿/已发布，默认草稿
+    start_date: datetime | None = None  # Start Date
+    end_date: datetime | None = None  # End Date
+    description: str | None = None  # 描述
+    hf_dataset_url: str | None = None  # 训练数据集HF的URL
+    pdf_file_url: str | None = None  # PDF任务文件URL
     announcement_duration: float = Field(..., description="Duration in days")
     execution_duration: float = Field(..., description="Duration in days")
     review_duration: float = Field(..., description="Duration in days")
@@ -55,43 +67,43 @@ class TaskPublishRequest(BaseModel):
 class TaskPublishResponse(BaseModel):
     status: str
     workflow_id: str
-    announcement_start: Optional[datetime]
-    execution_start: Optional[datetime]
-    review_start: Optional[datetime]
-    reward_start: Optional[datetime]
-    workflow_end: Optional[datetime]
+    announcement_start: datetime | None
+    execution_start: datetime | None
+    review_start: datetime | None
+    reward_start: datetime | None
+    workflow_end: datetime | None
     message: str
 
 
 class TaskQueryRequest(BaseModel):
-    workflow_id: Optional[str] = None
-    status: Optional[str] = None
-    workflow_type: Optional[str] = None
+    workflow_id: str | None = None
+    status: str | None = None
+    workflow_type: str | None = None
     page: int = 1
     page_size: int = 20
 
 
 class TaskInfo(BaseModel):
-    task_id: Optional[str] = None  # User-defined task ID
+    task_id: str | None = None  # User-defined task ID
     workflow_id: str
     workflow_type: str
     status: str
-    display_status: Optional[str] = None  # not_started/in_progress/completed
-    publish_status: Optional[str] = "draft"  # 草稿/已发布
-    start_date: Optional[datetime] = None  # Start Date
-    end_date: Optional[datetime] = None  # End Date
-    description: Optional[str] = None  # 描述
-    hf_dataset_url: Optional[str] = None  # 训练数据集HF的URL
-    pdf_file_url: Optional[str] = None  # PDF任务文件URL
-    workflow_spec: Optional[Dict[str, Any]] = None  # Workflow specification JSON
-    announcement_start: Optional[datetime] = None
-    execution_start: Optional[datetime] = None
-    review_start: Optional[datetime] = None
-    reward_start: Optional[datetime] = None
-    workflow_end: Optional[datetime] = None
-    created_at: Optional[datetime] = None
+    display_status: Literal["not_started", "in_progress", "completed"] | None = None
+    publish_status: str | None = "draft"  # 草稿/已发布
+    start_date: datetime | None = None  # Start Date
+    end_date: datetime | None = None  # End Date
+    description: str | None = None  # 描述
+    hf_dataset_url: str | None = None  # 训练数据集HF的URL
+    pdf_file_url: str | None = None  # PDF任务文件URL
+    workflow_spec: dict[str, Any] | None = None  # Workflow specification JSON
+    announcement_start: datetime | None = None
+    execution_start: datetime | None = None
+    review_start: datetime | None = None
+    reward_start: datetime | None = None
+    workflow_end: datetime | None = None
+    created_at: datetime | None = None
 
 
 class TaskListResponse(BaseModel):
-    workflows: List[TaskInfo]
-    pagination: Dict[str, Any]
+    workflows: list[TaskInfo]
+    pagination: dict[str, Any]
@@ -1,50 +1,59 @@
-from pydantic import BaseModel
-from typing import Optional, Dict, Any
+from __future__ import annotations
+
+from pydantic import BaseModel, ConfigDict, TypeAdapter
+from typing import Any
 from datetime import datetime
 
+from kokoro.website_admin.schemas.partial import partial_model
+
 
 class TaskTemplateCreate(BaseModel):
     name: str
-    description: Optional[str] = None
+    description: str | None = None
     workflow_type: str
-    workflow_spec: Dict[str, Any]
-    announcement_duration: Optional[str] = "0.25"
-    execution_duration: Optional[str] = "3.0"
-    review_duration: Optional[str] = "1.0"
-    reward_duration: Optional[str] = "0.0"
-    is_active: Optional[bool] = True
+    workflow_spec: dict[str, Any]
+    announcement_duration: str | None = "0.25"
+    execution_duration: str | None = "3.0"
+    review_duration: str | None = "1.0"
+    reward_duration: str | None = "0.0"
+    is_active: bool | None = True
 
 
-class TaskTemplateUpdate(BaseModel):
-    name: Optional[str] = None
-    description: Optional[str] = None
-    workflow_spec: Optional[Dict[str, Any]] = None
-    announcement_duration: Optional[str] = None
-    execution_duration: Optional[str] = None
-    review_duration: Optional[str] = None
-    reward_duration: Optional[str] = None
-    is_active: Optional[bool] = None
+# Create fields minus workflow_type (immutable once created), optional for PATCH
+TaskTemplateUpdate = partial_model(
+    "TaskTemplateUpdate", TaskTemplateCreate, exclude=("workflow_type",)
+)
 
 
 class TaskTemplateResponse(BaseModel):
     id: int
     name: str
-    description: Optional[str]
+    description: str | None
     workflow_type: str
-    workflow_spec: Dict[str, Any]
+    workflow_spec: dict[str, Any]
     announcement_duration: str
     execution_duration: str
     review_duration: str
     reward_duration: str
     is_active: bool
-    created_at: Optional[datetime] = None
-    updated_at: Optional[datetime] = None
+    created_at: datetime | None = None
+    updated_at: datetime | None = None
+
+    model_config = ConfigDict(from_attributes=True)
+
 
-    class Config:
-        from_attributes = True
+# Built once at import; re-creating a TypeAdapter per call rebuilds the validator
+_TEMPLATE_LIST_ADAPTER = TypeAdapter(list[TaskTemplateResponse])
 
 
 class TaskTemplateListResponse(BaseModel):
     templates: list[TaskTemplateResponse]
     total: int
 
+    @classmethod
+    def validate_rows(cls, rows, total: int) -> "TaskTemplateListResponse":
+        """Batch-validate rows through the pre-compiled list adapter."""
+        return cls.model_construct(
+            templates=_TEMPLATE_LIST_ADAPTER.validate_python(rows, from_attributes=True),
+            total=total,
+        )
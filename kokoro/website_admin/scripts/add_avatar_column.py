@@ -19,24 +19,14 @@ def add_avatar_column():
     """Add avatar column to users table."""
     try:
         with engine.begin() as conn:
-            # Check if column exists
-            result = conn.execute(text("""
-                SELECT column_name 
-                FROM information_schema.columns 
-                WHERE table_name = 'users' AND column_name = 'avatar'
-            """))
-            exists = result.fetchone() is not None
-            
-            if exists:
-                logger.info("Avatar column already exists in users table")
-                return True
-            
-            # Add the column
+            # IF NOT EXISTS folds the information_schema check and the DDL
+            # into one round-trip, with no race against other workers
             logger.info("Adding avatar column to users table...")
-            conn.execute(text("ALTER TABLE users ADD COLUMN avatar VARCHAR(255)"))
-            logger.info("Avatar column added successfully")
+            conn.execute(text("ALTER TABLE users ADD COLUMN IF NOT EXISTS avatar VARCHAR(255)"))
+            logger.info("Avatar column ensured successfully")
             return True
-            
+
+
     except Exception as e:
         logger.error(f"Failed to add avatar column: {e}", exc_info=True)
         return False
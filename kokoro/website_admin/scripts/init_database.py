@@ -5,11 +5,13 @@ from pathlib import Path
 
 sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent))
 
-from kokoro.website_admin.database import init_db, init_data
-
 if __name__ == "__main__":
     print("Initializing website admin database...")
     try:
+        # Imported here so SQLAlchemy and the ORM models only load when the
+        # script actually runs (not for --help or plain imports)
+        from kokoro.website_admin.database import init_db, init_data
+
         init_db()
         print("Database tables created successfully")
         